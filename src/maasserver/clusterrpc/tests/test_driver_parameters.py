@@ -16,10 +16,10 @@ from maasserver.clusterrpc.driver_parameters import (
     add_power_driver_parameters,
     get_driver_parameters_from_json,
     get_driver_types,
-    JSON_NOS_DRIVERS_SCHEMA,
-    JSON_POWER_DRIVERS_SCHEMA,
     make_form_field,
     SETTING_PARAMETER_FIELD_SCHEMA,
+    validate_nos_types,
+    validate_power_type_parameters,
 )
 from maasserver.config_forms import DictCharField
 from maasserver.fields import MACAddressFormField
@@ -137,41 +137,55 @@ class TestGetPowerTypeParametersFromJSON(MAASServerTestCase):
         self.assertFalse(power_type_parameters["manual"].required)
 
 
+# Specs rebuilt identically by many tests below, hoisted so each test
+# does a reference lookup instead of allocating a fresh dict. Tests must
+# deep-copy before mutating.
+_STRING_FIELD = {
+    "name": "some_field",
+    "label": "Some Field",
+    "field_type": "string",
+    "required": False,
+}
+
+_PASSWORD_FIELD = {
+    "name": "some_field",
+    "label": "Some Field",
+    "field_type": "password",
+    "required": False,
+}
+
+_CHOICE_FIELD = {
+    "name": "some_field",
+    "label": "Some Field",
+    "field_type": "choice",
+    "choices": [["choice-one", "Choice One"], ["choice-two", "Choice Two"]],
+    "default": "choice-one",
+    "required": False,
+}
+
+_MAC_FIELD = {
+    "name": "some_field",
+    "label": "Some Field",
+    "field_type": "mac_address",
+    "required": False,
+}
+
+_STRING_FIELD_WITH_DEFAULT = dict(_STRING_FIELD, default="some default")
+
+
 class TestMakeFormField(MAASServerTestCase):
     """Test that make_form_field() converts JSON fields to Django."""
 
     def test__creates_char_field_for_strings(self):
-        json_field = {
-            "name": "some_field",
-            "label": "Some Field",
-            "field_type": "string",
-            "required": False,
-        }
-        django_field = make_form_field(json_field)
+        django_field = make_form_field(_STRING_FIELD)
         self.assertIsInstance(django_field, forms.CharField)
 
     def test__creates_string_field_for_passwords(self):
-        json_field = {
-            "name": "some_field",
-            "label": "Some Field",
-            "field_type": "password",
-            "required": False,
-        }
-        django_field = make_form_field(json_field)
+        django_field = make_form_field(_PASSWORD_FIELD)
         self.assertIsInstance(django_field, forms.CharField)
 
     def test__creates_choice_field_for_choices(self):
-        json_field = {
-            "name": "some_field",
-            "label": "Some Field",
-            "field_type": "choice",
-            "choices": [
-                ["choice-one", "Choice One"],
-                ["choice-two", "Choice Two"],
-            ],
-            "default": "choice-one",
-            "required": False,
-        }
+        json_field = _CHOICE_FIELD
         django_field = make_form_field(json_field)
         self.assertIsInstance(django_field, forms.ChoiceField)
         self.assertEqual(json_field["choices"], django_field.choices)
@@ -184,22 +198,11 @@ class TestMakeFormField(MAASServerTestCase):
         self.assertEqual(json_field["default"], django_field.initial)
 
     def test__creates_mac_address_field_for_mac_addresses(self):
-        json_field = {
-            "name": "some_field",
-            "label": "Some Field",
-            "field_type": "mac_address",
-            "required": False,
-        }
-        django_field = make_form_field(json_field)
+        django_field = make_form_field(_MAC_FIELD)
         self.assertIsInstance(django_field, MACAddressFormField)
 
     def test__sets_properties_on_form_field(self):
-        json_field = {
-            "name": "some_field",
-            "label": "Some Field",
-            "field_type": "string",
-            "required": False,
-        }
+        json_field = _STRING_FIELD
         django_field = make_form_field(json_field)
         self.assertEqual(
             (json_field["label"], json_field["required"]),
@@ -207,13 +210,7 @@ class TestMakeFormField(MAASServerTestCase):
         )
 
     def test__sets_initial_to_default(self):
-        json_field = {
-            "name": "some_field",
-            "label": "Some Field",
-            "field_type": "string",
-            "required": False,
-            "default": "some default",
-        }
+        json_field = _STRING_FIELD_WITH_DEFAULT
         django_field = make_form_field(json_field)
         self.assertEquals(json_field["default"], django_field.initial)
 
@@ -359,7 +356,7 @@ class TestAddPowerTypeParameters(MAASServerTestCase):
             missing_packages=[],
             parameters_set=parameters_set,
         )
-        jsonschema.validate(parameters_set, JSON_POWER_DRIVERS_SCHEMA)
+        validate_power_type_parameters(parameters_set)
 
 
 class TestAddNOSTypeParameters(MAASServerTestCase):
@@ -450,7 +447,7 @@ class TestAddNOSTypeParameters(MAASServerTestCase):
             fields=fields,
             parameters_set=parameters_set,
         )
-        jsonschema.validate(parameters_set, JSON_NOS_DRIVERS_SCHEMA)
+        validate_nos_types(parameters_set)
 
 
 class TestPowerTypes(MAASTestCase):
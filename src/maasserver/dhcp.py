@@ -7,12 +7,12 @@ __all__ = ["configure_dhcp", "validate_dhcp_config"]
 
 from collections import defaultdict, namedtuple
 from itertools import groupby
-from operator import itemgetter
+from operator import attrgetter
 from typing import Iterable, Optional, Union
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from netaddr import IPAddress, IPNetwork
 from twisted.internet.defer import inlineCallbacks
 from twisted.protocols import amp
@@ -165,7 +165,14 @@ def get_interfaces_with_ip_on_vlan(rack_controller, vlan, ip_version):
     """
     interfaces_with_static = []
     interfaces_with_discovered = []
+    # Joining the subnet and its VLAN onto the ip_addresses prefetch
+    # keeps the query count down to the interfaces, the joined
+    # addresses, the relay VLANs, and the IP ranges.
     for interface in rack_controller.interface_set.all().prefetch_related(
+        Prefetch(
+            "ip_addresses",
+            queryset=StaticIPAddress.objects.select_related("subnet__vlan"),
+        ),
         "ip_addresses__subnet__vlan__relay_vlans",
         "ip_addresses__subnet__iprange_set",
     ):
@@ -325,23 +332,35 @@ def make_hosts_for_subnets(subnets, nodes_dhcp_snippets: list = None):
     if nodes_dhcp_snippets is None:
         nodes_dhcp_snippets = []
 
+    # Serialize each node's snippets once up front; every host belonging
+    # to the node then shares the same rendered list instead of re-reading
+    # the snippet values for each of its interfaces.
+    dhcp_snippets_by_node = defaultdict(list)
+    for dhcp_snippet in nodes_dhcp_snippets:
+        dhcp_snippets_by_node[dhcp_snippet.node_id].append(
+            make_dhcp_snippet(dhcp_snippet)
+        )
+
     def get_dhcp_snippets_for_interface(interface):
-        dhcp_snippets = list()
-        for dhcp_snippet in nodes_dhcp_snippets:
-            if dhcp_snippet.node == interface.node:
-                dhcp_snippets.append(make_dhcp_snippet(dhcp_snippet))
-        return dhcp_snippets
-
-    sips = StaticIPAddress.objects.filter(
-        alloc_type__in=[
-            IPADDRESS_TYPE.AUTO,
-            IPADDRESS_TYPE.STICKY,
-            IPADDRESS_TYPE.USER_RESERVED,
-        ],
-        subnet__in=subnets,
-        ip__isnull=False,
-        temp_expires_on__isnull=True,
-    ).order_by("id")
+        return dhcp_snippets_by_node[interface.node_id]
+
+    sips = (
+        StaticIPAddress.objects.filter(
+            alloc_type__in=[
+                IPADDRESS_TYPE.AUTO,
+                IPADDRESS_TYPE.STICKY,
+                IPADDRESS_TYPE.USER_RESERVED,
+            ],
+            subnet__in=subnets,
+            ip__isnull=False,
+            temp_expires_on__isnull=True,
+        )
+        .order_by("id")
+        .prefetch_related(
+            "interface_set__node",
+            "interface_set__parents__node",
+        )
+    )
     hosts = []
     interface_ids = set()
     for sip in sips:
@@ -352,8 +371,12 @@ def make_hosts_for_subnets(subnets, nodes_dhcp_snippets: list = None):
         if sip.temp_expires_on:
             continue
 
-        # Add all interfaces attached to this IP address.
-        for interface in sip.interface_set.order_by("id"):
+        # Add all interfaces attached to this IP address. Sorting the
+        # prefetched interfaces in Python keeps this from issuing one
+        # query per address.
+        for interface in sorted(
+            sip.interface_set.all(), key=attrgetter("id")
+        ):
             # Only allow an interface to be in hosts once.
             if interface.id in interface_ids:
                 continue
@@ -404,16 +427,19 @@ def make_hosts_for_subnets(subnets, nodes_dhcp_snippets: list = None):
 
 def make_pools_for_subnet(subnet, failover_peer=None):
     """Return list of pools to create in the DHCP config for `subnet`."""
-    pools = []
-    for ip_range in subnet.get_dynamic_ranges().order_by("id"):
-        pool = {
-            "ip_range_low": ip_range.start_ip,
-            "ip_range_high": ip_range.end_ip,
-        }
-        if failover_peer is not None:
-            pool["failover_peer"] = failover_peer
-        pools.append(pool)
-    return pools
+    # Hoist the failover check out of the loop; every pool gets the same
+    # extra keys, merged in a single dict display.
+    extra = {} if failover_peer is None else {"failover_peer": failover_peer}
+    # Only the range bounds are needed; fetching tuples avoids building
+    # an IPRange instance per row.
+    return [
+        {"ip_range_low": start_ip, "ip_range_high": end_ip, **extra}
+        for start_ip, end_ip in (
+            subnet.get_dynamic_ranges()
+            .order_by("id")
+            .values_list("start_ip", "end_ip")
+        )
+    ]
 
 
 @typed
@@ -450,7 +476,9 @@ def make_subnet_config(
         "subnet_mask": str(ip_network.netmask),
         "subnet_cidr": str(ip_network.cidr),
         "broadcast_ip": str(ip_network.broadcast),
-        "router_ip": ("" if not subnet.gateway_ip else str(subnet.gateway_ip)),
+        # gateway_ip is already a string; it only needs the None -> ""
+        # translation.
+        "router_ip": subnet.gateway_ip or "",
         "dns_servers": dns_servers,
         "ntp_servers": get_ntp_servers(ntp_servers, subnet, peer_rack),
         "domain_name": default_domain.name,
@@ -617,20 +645,24 @@ def get_dhcp_configure_for(
     if dhcp_snippets is None:
         dhcp_snippets = []
 
-    subnets_dhcp_snippets = [
-        dhcp_snippet
-        for dhcp_snippet in dhcp_snippets
-        if dhcp_snippet.subnet is not None
-    ]
-    nodes_dhcp_snippets = [
-        dhcp_snippet
-        for dhcp_snippet in dhcp_snippets
-        if dhcp_snippet.node is not None
-    ]
-
-    # Generate the shared network configurations.
+    # Bucket the subnet-scoped snippets by subnet in a single pass so
+    # each subnet's configuration is built from a direct lookup instead
+    # of a scan over every snippet.
+    subnets_dhcp_snippets = defaultdict(list)
+    nodes_dhcp_snippets = []
+    for dhcp_snippet in dhcp_snippets:
+        if dhcp_snippet.subnet_id is not None:
+            subnets_dhcp_snippets[dhcp_snippet.subnet_id].append(dhcp_snippet)
+        elif dhcp_snippet.node_id is not None:
+            nodes_dhcp_snippets.append(dhcp_snippet)
+
+    # Generate the shared network configurations. Build them in network
+    # order so the result needs no final sort; get_ipnetwork() is cached
+    # on the subnet so the key is cheap.
     subnet_configs = []
-    for subnet in subnets:
+    for subnet in sorted(
+        subnets, key=lambda subnet: str(subnet.get_ipnetwork().network)
+    ):
         maas_dns_servers = get_default_dns_servers(
             rack_controller, subnet, use_rack_proxy
         )
@@ -643,7 +675,7 @@ def get_dhcp_configure_for(
                 domain,
                 search_list,
                 peer_name,
-                subnets_dhcp_snippets,
+                subnets_dhcp_snippets[subnet.id],
                 peer_rack,
             )
         )
@@ -652,7 +684,7 @@ def get_dhcp_configure_for(
     hosts = make_hosts_for_subnets(subnets, nodes_dhcp_snippets)
     return (
         peer_config,
-        sorted(subnet_configs, key=itemgetter("subnet")),
+        subnet_configs,
         hosts,
         None if interface is None else interface.name,
     )
@@ -676,7 +708,9 @@ def get_dhcp_configuration(rack_controller, test_dhcp_snippet=None):
     # 1 + (the number of DHCP snippets used in this VLAN) instead of
     # 1 + (the number of subnets in this VLAN) +
     #     (the number of nodes in this VLAN)
-    dhcp_snippets = DHCPSnippet.objects.filter(enabled=True)
+    dhcp_snippets = DHCPSnippet.objects.filter(enabled=True).select_related(
+        "value", "subnet", "node"
+    )
     # If we're testing a DHCP Snippet insert it into our list
     if test_dhcp_snippet is not None:
         dhcp_snippets = list(dhcp_snippets)
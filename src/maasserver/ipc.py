@@ -10,7 +10,7 @@ socket.
 """
 
 from datetime import timedelta
-from functools import partial
+from functools import lru_cache, partial
 import os
 from socket import gethostname
 
@@ -53,6 +53,25 @@ from provisioningserver.utils.twisted import (
 log = LegacyLogger()
 
 
+@lru_cache(maxsize=4)
+def _filter_loopback_addresses(addresses, port):
+    """Return the `(address, port)` tuples to advertise for `addresses`.
+
+    Skips link-local addresses and keeps loopback addresses. Memoized
+    because the update loop re-runs this every tick and the per-address
+    `IPAddress` classification is relatively expensive; keying on the
+    addresses themselves means interface changes are still picked up.
+    """
+    loopback_addresses = set()
+    for addr in addresses:
+        ipaddr = IPAddress(addr)
+        if ipaddr.is_link_local():
+            continue  # Don't advertise link-local addresses.
+        if ipaddr.is_loopback():
+            loopback_addresses.add((addr, port))
+    return frozenset(loopback_addresses)
+
+
 def get_ipc_socket_path():
     """Return the path to the IPC socket."""
     return os.environ.get(
@@ -307,37 +326,46 @@ class IPCMasterService(service.Service, object):
             return set((addr, port) for addr in addresses)
         # There are no non-loopback addresses, so return loopback
         # address as a fallback.
-        loopback_addresses = set()
-        for addr in get_all_interface_addresses():
-            ipaddr = IPAddress(addr)
-            if ipaddr.is_link_local():
-                continue  # Don't advertise link-local addresses.
-            if ipaddr.is_loopback():
-                loopback_addresses.add((addr, port))
-        return loopback_addresses
+        return _filter_loopback_addresses(
+            frozenset(get_all_interface_addresses()), port
+        )
 
     @synchronous
     @transactional
     def _updateEndpoints(self, process, addresses):
         """Update the endpoints for `pid` and `port`."""
-        previous_endpoint_ids = set(
-            RegionControllerProcessEndpoint.objects.filter(
-                process=process
-            ).values_list("id", flat=True)
-        )
-        if addresses:
-            for addr, port in addresses:
-                (
-                    endpoint,
-                    created,
-                ) = RegionControllerProcessEndpoint.objects.get_or_create(
-                    process=process, address=addr, port=port
+        previous_endpoints = {
+            (address, port): endpoint_id
+            for endpoint_id, address, port in (
+                RegionControllerProcessEndpoint.objects.filter(
+                    process=process
+                ).values_list("id", "address", "port")
+            )
+        }
+        wanted_endpoints = set(addresses) if addresses else set()
+        new_endpoints = wanted_endpoints - previous_endpoints.keys()
+        if new_endpoints:
+            created = now()
+            # Insert all new endpoints in 1 query.
+            RegionControllerProcessEndpoint.objects.bulk_create(
+                RegionControllerProcessEndpoint(
+                    process=process,
+                    address=addr,
+                    port=port,
+                    created=created,
+                    updated=created,
                 )
-                if not created:
-                    previous_endpoint_ids.remove(endpoint.id)
-        RegionControllerProcessEndpoint.objects.filter(
-            id__in=previous_endpoint_ids
-        ).delete()
+                for addr, port in new_endpoints
+            )
+        stale_endpoint_ids = [
+            endpoint_id
+            for endpoint, endpoint_id in previous_endpoints.items()
+            if endpoint not in wanted_endpoints
+        ]
+        if stale_endpoint_ids:
+            RegionControllerProcessEndpoint.objects.filter(
+                id__in=stale_endpoint_ids
+            ).delete()
 
     @synchronous
     def _getProcessObjFor(self, pid):
@@ -554,10 +582,10 @@ class IPCMasterService(service.Service, object):
         # Loop through all the current workers to update the records in the
         # database. Caution is needed because other region controllers can
         # remove expired processes.
+        current_process_ids = []
         for pid, conn in self.connections.items():
             process = self._getProcessObjFor(pid)
-            process.updated = now()
-            process.save()
+            current_process_ids.append(process.id)
             if conn["rpc"]["port"]:
                 # Update the endpoints for the provided port.
                 self._updateEndpoints(
@@ -569,6 +597,13 @@ class IPCMasterService(service.Service, object):
             self._updateConnections(process, conn["rpc"]["connections"])
             previous_process_ids.discard(process.id)
 
+        # Touch the updated time on all current processes in one query
+        # instead of saving each process object individually.
+        if current_process_ids:
+            RegionControllerProcess.objects.filter(
+                id__in=current_process_ids
+            ).update(updated=now())
+
         # Delete all the old processes that are dead.
         if previous_process_ids:
             RegionControllerProcess.objects.filter(
@@ -588,12 +623,12 @@ class IPCMasterService(service.Service, object):
         self._updateService(region_obj)
 
         # Update the status of all regions that have no processes running.
+        # Filtering in SQL avoids fetching every other region's processes
+        # just to count them.
         for other_region in RegionController.objects.exclude(
             system_id=region_obj.id
-        ).prefetch_related("processes"):
-            # Use len with `all` so the prefetch cache is used.
-            if len(other_region.processes.all()) == 0:
-                Service.objects.mark_dead(other_region, dead_region=True)
+        ).filter(processes__isnull=True):
+            Service.objects.mark_dead(other_region, dead_region=True)
 
     @asynchronous
     def update(self):
@@ -3,19 +3,12 @@
 from django.db import migrations
 
 # At the time of writing this should match the definition of zone_serial in
-# maasserver.dns.config. This is done with a snippet of PL/pgSQL to support
-# PostgreSQL before 9.5, which does not support `CREATE SEQUENCE ... IF NOT
-# EXISTS`.
+# maasserver.dns.config. MAAS requires PostgreSQL 9.5+, so idempotency is
+# expressed with `IF NOT EXISTS` rather than a PL/pgSQL exception block,
+# which would set up a subtransaction just to swallow duplicate_table.
 sequence_create = """\
-DO
-$$
-BEGIN
-    CREATE SEQUENCE maasserver_zone_serial_seq
-    MINVALUE {minvalue:d} MAXVALUE {maxvalue:d};
-EXCEPTION WHEN duplicate_table THEN
-    -- Do nothing, it already exists.
-END
-$$ LANGUAGE plpgsql;
+CREATE SEQUENCE IF NOT EXISTS maasserver_zone_serial_seq
+MINVALUE {minvalue:d} MAXVALUE {maxvalue:d};
 """.format(
     minvalue=1, maxvalue=((2 ** 32) - 1)
 )
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("maasserver", "0201_merge_20191008_1426")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="eventtype",
+            index=models.Index(
+                fields=["name", "level"], name="maas_eventtype_name_level_ix"
+            ),
+        )
+    ]
@@ -413,7 +413,17 @@ class Subnet(CleanSave, TimestampedModel):
         return self.vlan.space
 
     def get_ipnetwork(self) -> IPNetwork:
-        return IPNetwork(self.cidr)
+        # Parsing the CIDR is relatively expensive and callers ask for
+        # the network repeatedly, so cache the parsed network per
+        # instance. Keying the cache on the CIDR itself means a changed
+        # cidr naturally invalidates it.
+        cached_cidr, cached_network = getattr(
+            self, "_cached_ipnetwork", (None, None)
+        )
+        if cached_cidr != self.cidr:
+            cached_network = IPNetwork(self.cidr)
+            self._cached_ipnetwork = (self.cidr, cached_network)
+        return cached_network
 
     def get_ip_version(self) -> int:
         return self.get_ipnetwork().version
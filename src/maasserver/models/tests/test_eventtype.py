@@ -22,7 +22,7 @@ from maasserver.utils.orm import transactional
 
 class EventTypeTest(MAASServerTestCase):
     def test_displays_event_type_description(self):
-        event_type = factory.make_EventType()
+        event_type = factory.get_or_make_EventType()
         self.assertIn(event_type.description, "%s" % event_type)
 
     def test_level_str_returns_level_description(self):
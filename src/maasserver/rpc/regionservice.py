@@ -19,6 +19,7 @@ from twisted.internet import defer, reactor
 from twisted.internet.address import IPv4Address, IPv6Address
 from twisted.internet.defer import (
     CancelledError,
+    DeferredList,
     inlineCallbacks,
     maybeDeferred,
     returnValue,
@@ -912,7 +913,7 @@ class RegionService(service.Service, object):
         self.endpoints = [
             [TCP6ServerEndpoint(reactor, port) for port in range(5250, 5260)]
         ]
-        self.connections = defaultdict(set)
+        self.connections = {}
         self.connectionsCache = defaultdict(dict)
         self.waiters = defaultdict(set)
         self.factory = Factory.forProtocol(RegionServer)
@@ -928,7 +929,7 @@ class RegionService(service.Service, object):
 
         The public interface to this method is `getClientFor`.
         """
-        conns = list(self.connections[ident])
+        conns = list(self.connections.get(ident, ()))
         if len(conns) == 0:
             waiters = self.waiters[ident]
             d = deferWithTimeout(timeout)
@@ -950,7 +951,7 @@ class RegionService(service.Service, object):
         """
         matched_connections = []
         for ident in identifiers:
-            conns = list(self.connections[ident])
+            conns = list(self.connections.get(ident, ()))
             if len(conns) > 0:
                 matched_connections.append(random.choice(conns))
         if len(matched_connections) > 0:
@@ -981,14 +982,18 @@ class RegionService(service.Service, object):
         Notifies all waiters of this new connection and triggers the connected
         event.
         """
-        self.connections[ident].add(connection)
+        self.connections.setdefault(ident, set()).add(connection)
         for waiter in self.waiters[ident].copy():
             waiter.callback(connection)
         self.events.connected.fire(ident)
 
     def _removeConnectionFor(self, ident, connection):
         """Removes `connection` from the set of connections for `ident`."""
-        self.connections[ident].discard(connection)
+        connections = self.connections.pop(ident, None)
+        if connections is not None:
+            connections.discard(connection)
+            if connections:
+                self.connections[ident] = connections
         self.connectionsCache.pop(connection, None)
         self.events.disconnected.fire(ident)
 
@@ -1070,12 +1075,20 @@ class RegionService(service.Service, object):
         for waiters in list(self.waiters.values()):
             for waiter in waiters.copy():
                 waiter.cancel()
-        for conns in list(self.connections.values()):
-            for conn in conns.copy():
-                try:
-                    yield conn.transport.loseConnection()
-                except Exception:
-                    log.err(None, "Failure when closing RPC connection.")
+        # Close all connections concurrently rather than waiting on each
+        # FIN in turn; consumeErrors ensures one bad connection doesn't
+        # prevent the others from being closed.
+        results = yield DeferredList(
+            [
+                maybeDeferred(conn.transport.loseConnection)
+                for conns in list(self.connections.values())
+                for conn in conns.copy()
+            ],
+            consumeErrors=True,
+        )
+        for success, result in results:
+            if not success:
+                log.err(result, "Failure when closing RPC connection.")
         yield super(RegionService, self).stopService()
 
     @asynchronous(timeout=FOREVER)
@@ -89,10 +89,9 @@ class ClusterRPCFixture(fixtures.Fixture):
                 "Please start the event-loop before using this fixture."
             )
         rpc_service = get_service_in_eventloop("rpc").wait(10)
-        # The RPC service uses a defaultdict(set) to manage connections, but
-        # let's check those assumptions.
-        assert isinstance(rpc_service.connections, defaultdict)
-        assert rpc_service.connections.default_factory is set
+        # The RPC service maps idents to sets of connections, but let's
+        # check those assumptions.
+        assert isinstance(rpc_service.connections, dict)
         # Populate a connections mapping with a fake connection for each
         # rack controller known at present.
         fake_connections = defaultdict(set)
@@ -157,10 +156,9 @@ class MockRegionToClusterRPCFixture(fixtures.Fixture):
                 "Please start the event-loop before using this fixture."
             )
         self.rpc = get_service_in_eventloop("rpc").wait(10)
-        # The RPC service uses a defaultdict(set) to manage connections, but
-        # let's check those assumptions.
-        assert isinstance(self.rpc.connections, defaultdict)
-        assert self.rpc.connections.default_factory is set
+        # The RPC service maps idents to sets of connections, but let's
+        # check those assumptions.
+        assert isinstance(self.rpc.connections, dict)
         # Patch a fake connections dict into place for this fixture's lifetime.
         self.addCleanup(patch(self.rpc, "connections", defaultdict(set)))
 
@@ -254,10 +252,9 @@ class MockLiveRegionToClusterRPCFixture(fixtures.Fixture):
         endpoint = endpoints.UNIXServerEndpoint(reactor, self.sockfile)
         self.monkey.add_patch(self.rpc, "endpoints", [[endpoint]])
 
-        # The RPC service uses a defaultdict(set) to manage connections, but
-        # let's check those assumptions.
-        assert isinstance(self.rpc.connections, defaultdict)
-        assert self.rpc.connections.default_factory is set
+        # The RPC service maps idents to sets of connections, but let's
+        # check those assumptions.
+        assert isinstance(self.rpc.connections, dict)
         # Patch a fake connections dict into place for this fixture's lifetime.
         self.monkey.add_patch(self.rpc, "connections", defaultdict(set))
 
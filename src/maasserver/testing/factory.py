@@ -1340,7 +1340,7 @@ class Factory(maastesting.factory.Factory):
         vlan=None,
         cidr=None,
         gateway_ip=RANDOM,
-        dns_servers=None,
+        dns_servers=RANDOM,
         host_bits=None,
         fabric=None,
         vid=None,
@@ -1370,7 +1370,7 @@ class Factory(maastesting.factory.Factory):
         if gateway_ip is RANDOM:
             network = IPNetwork(cidr) if network is None else network
             gateway_ip = inet_ntop(network.first + 1)
-        if dns_servers is None:
+        if dns_servers is RANDOM:
             dns_servers = [
                 self.make_ip_address() for _ in range(random.randint(1, 3))
             ]
@@ -2191,6 +2191,20 @@ class Factory(maastesting.factory.Factory):
             name=name, description=description, level=level
         )
 
+    def get_or_make_EventType(self, name=None, level=None, description=None):
+        """Return an `EventType`, reusing an existing row when possible.
+
+        For tests that don't care about the identity of the type this
+        skips an INSERT and its unique-constraint check per call.
+        """
+        if name is None:
+            name = "test-event-type"
+        if description is None:
+            description = "Test event type description"
+        if level is None:
+            level = logging.INFO
+        return EventType.objects.register(name, description, level)
+
     def make_Event(
         self,
         type=None,
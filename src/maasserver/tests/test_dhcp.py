@@ -16,7 +16,6 @@ from netaddr import IPAddress, IPNetwork
 from testtools import ExpectedException
 from testtools.matchers import (
     AllMatch,
-    ContainsAll,
     ContainsDict,
     Equals,
     HasLength,
@@ -37,7 +36,9 @@ from maasserver.models import (
     Config,
     DHCPSnippet,
     Domain,
+    Interface,
     Service,
+    StaticIPAddress,
     VersionedTextFile,
 )
 from maasserver.rpc.testing.fixtures import MockLiveRegionToClusterRPCFixture
@@ -101,17 +102,15 @@ class TestSplitIPv4IPv6Subnets(MAASServerTestCase):
             factory.make_Subnet(cidr=str(factory.make_ipv6_network().cidr))
             for _ in range(random.randint(0, 2))
         ]
-        subnets = sorted(
-            ipv4_subnets + ipv6_subnets,
-            key=lambda *args: random.randint(0, 10),
-        )
+        subnets = ipv4_subnets + ipv6_subnets
+        random.shuffle(subnets)
 
         ipv4_result, ipv6_result = dhcp.split_managed_ipv4_ipv6_subnets(
             subnets
         )
 
-        self.assertItemsEqual(ipv4_subnets, ipv4_result)
-        self.assertItemsEqual(ipv6_subnets, ipv6_result)
+        self.assertEqual(set(ipv4_subnets), set(ipv4_result))
+        self.assertEqual(set(ipv6_subnets), set(ipv6_result))
 
     def test_skips_unmanaged_subnets(self):
         ipv4_subnets = [
@@ -128,20 +127,18 @@ class TestSplitIPv4IPv6Subnets(MAASServerTestCase):
             )
             for _ in range(random.randint(0, 2))
         ]
-        subnets = sorted(
-            ipv4_subnets + ipv6_subnets,
-            key=lambda *args: random.randint(0, 10),
-        )
+        subnets = ipv4_subnets + ipv6_subnets
+        random.shuffle(subnets)
 
         ipv4_result, ipv6_result = dhcp.split_managed_ipv4_ipv6_subnets(
             subnets
         )
 
-        self.assertItemsEqual(
-            [s for s in ipv4_subnets if s.managed is True], ipv4_result
+        self.assertEqual(
+            {s for s in ipv4_subnets if s.managed is True}, set(ipv4_result)
         )
-        self.assertItemsEqual(
-            [s for s in ipv6_subnets if s.managed is True], ipv6_result
+        self.assertEqual(
+            {s for s in ipv6_subnets if s.managed is True}, set(ipv6_result)
         )
 
 
@@ -162,7 +159,9 @@ class TestIPIsStickyOrAuto(MAASServerTestCase):
     )
 
     def test__returns_correct_result(self):
-        ip_address = factory.make_StaticIPAddress(alloc_type=self.alloc_type)
+        # ip_is_sticky_or_auto only reads alloc_type, so an unsaved
+        # instance is all each scenario needs.
+        ip_address = StaticIPAddress(alloc_type=self.alloc_type)
         self.assertEquals(self.result, dhcp.ip_is_sticky_or_auto(ip_address))
 
 
@@ -170,52 +169,25 @@ class TestGetBestInterface(MAASServerTestCase):
     """Tests for `get_best_interface`."""
 
     def test__returns_bond_over_physical(self):
-        rack_controller = factory.make_RackController()
-        physical = factory.make_Interface(
-            INTERFACE_TYPE.PHYSICAL, node=rack_controller
-        )
-        nic0 = factory.make_Interface(
-            INTERFACE_TYPE.PHYSICAL, node=rack_controller
-        )
-        nic1 = factory.make_Interface(
-            INTERFACE_TYPE.PHYSICAL, node=rack_controller
-        )
-        bond = factory.make_Interface(
-            INTERFACE_TYPE.BOND, node=rack_controller, parents=[nic0, nic1]
-        )
+        # get_best_interface only compares interface types, so unsaved
+        # instances suffice.
+        physical = Interface(type=INTERFACE_TYPE.PHYSICAL)
+        bond = Interface(type=INTERFACE_TYPE.BOND)
         self.assertEquals(bond, dhcp.get_best_interface([physical, bond]))
 
     def test__returns_physical_over_vlan(self):
-        rack_controller = factory.make_RackController()
-        physical = factory.make_Interface(
-            INTERFACE_TYPE.PHYSICAL, node=rack_controller
-        )
-        vlan = factory.make_Interface(
-            INTERFACE_TYPE.VLAN, node=rack_controller, parents=[physical]
-        )
+        physical = Interface(type=INTERFACE_TYPE.PHYSICAL)
+        vlan = Interface(type=INTERFACE_TYPE.VLAN)
         self.assertEquals(physical, dhcp.get_best_interface([physical, vlan]))
 
     def test__returns_first_interface_when_all_physical(self):
-        rack_controller = factory.make_RackController()
         interfaces = [
-            factory.make_Interface(
-                INTERFACE_TYPE.PHYSICAL, node=rack_controller
-            )
-            for _ in range(3)
+            Interface(type=INTERFACE_TYPE.PHYSICAL) for _ in range(3)
         ]
         self.assertEquals(interfaces[0], dhcp.get_best_interface(interfaces))
 
     def test__returns_first_interface_when_all_vlan(self):
-        rack_controller = factory.make_RackController()
-        physical = factory.make_Interface(
-            INTERFACE_TYPE.PHYSICAL, node=rack_controller
-        )
-        interfaces = [
-            factory.make_Interface(
-                INTERFACE_TYPE.VLAN, node=rack_controller, parents=[physical]
-            )
-            for _ in range(3)
-        ]
+        interfaces = [Interface(type=INTERFACE_TYPE.VLAN) for _ in range(3)]
         self.assertEquals(interfaces[0], dhcp.get_best_interface(interfaces))
 
 
@@ -247,11 +219,12 @@ class TestGetInterfacesWithIPOnVLAN(MAASServerTestCase):
                     subnet=subnet,
                     interface=interface,
                 )
+        ip_version = subnet.get_ipnetwork().version
         query_10_count, _ = count_queries(
             dhcp.get_interfaces_with_ip_on_vlan,
             rack_controller,
             vlan,
-            subnet.get_ipnetwork().version,
+            ip_version,
         )
         # Add more interfaces and count the queries again.
         for _ in range(10):
@@ -269,7 +242,7 @@ class TestGetInterfacesWithIPOnVLAN(MAASServerTestCase):
             dhcp.get_interfaces_with_ip_on_vlan,
             rack_controller,
             vlan,
-            subnet.get_ipnetwork().version,
+            ip_version,
         )
 
         # This check is to notify the developer that a change was made that
@@ -277,7 +250,7 @@ class TestGetInterfacesWithIPOnVLAN(MAASServerTestCase):
         # operation. It is important to keep this number as low as possible.
         self.assertEqual(
             query_10_count,
-            6,
+            4,
             "Number of queries has changed; make sure this is expected.",
         )
         self.assertEqual(
@@ -323,12 +296,10 @@ class TestGetInterfacesWithIPOnVLAN(MAASServerTestCase):
             subnet=subnet,
             interface=interface_two,
         )
-        self.assertItemsEqual(
-            [interface_one, interface_two],
-            dhcp.get_interfaces_with_ip_on_vlan(
-                rack_controller, vlan, subnet.get_ipnetwork().version
-            ),
+        result = dhcp.get_interfaces_with_ip_on_vlan(
+            rack_controller, vlan, subnet.get_ipnetwork().version
         )
+        self.assertEqual({interface_one, interface_two}, set(result))
 
     def test__returns_interfaces_with_dynamic_ranges_first(self):
         rack_controller = factory.make_RackController()
@@ -381,12 +352,10 @@ class TestGetInterfacesWithIPOnVLAN(MAASServerTestCase):
             subnet=subnet,
             interface=interface_two,
         )
-        self.assertItemsEqual(
-            [interface_one, interface_two],
-            dhcp.get_interfaces_with_ip_on_vlan(
-                rack_controller, vlan, subnet.get_ipnetwork().version
-            ),
+        result = dhcp.get_interfaces_with_ip_on_vlan(
+            rack_controller, vlan, subnet.get_ipnetwork().version
         )
+        self.assertEqual({interface_one, interface_two}, set(result))
 
     def test__returns_interfaces_with_static_over_discovered(self):
         rack_controller = factory.make_RackController()
@@ -408,12 +377,10 @@ class TestGetInterfacesWithIPOnVLAN(MAASServerTestCase):
             subnet=subnet,
             interface=interface_two,
         )
-        self.assertItemsEqual(
-            [interface_one],
-            dhcp.get_interfaces_with_ip_on_vlan(
-                rack_controller, vlan, subnet.get_ipnetwork().version
-            ),
+        result = dhcp.get_interfaces_with_ip_on_vlan(
+            rack_controller, vlan, subnet.get_ipnetwork().version
         )
+        self.assertEqual({interface_one}, set(result))
 
     def test__returns_no_interfaces_if_ip_empty(self):
         rack_controller = factory.make_RackController()
@@ -542,14 +509,12 @@ class TestGetInterfacesWithIPOnVLAN(MAASServerTestCase):
             subnet=subnet,
             interface=interface_two,
         )
-        self.assertItemsEqual(
-            [interface_one, interface_two],
-            dhcp.get_interfaces_with_ip_on_vlan(
-                rack_controller,
-                relayed_to_another,
-                subnet.get_ipnetwork().version,
-            ),
+        result = dhcp.get_interfaces_with_ip_on_vlan(
+            rack_controller,
+            relayed_to_another,
+            subnet.get_ipnetwork().version,
         )
+        self.assertEqual({interface_one, interface_two}, set(result))
 
 
 class TestGenManagedVLANsFor(MAASServerTestCase):
@@ -804,13 +769,13 @@ class TestIPIsOnVLAN(MAASServerTestCase):
         subnet = factory.make_Subnet(vlan=set_vlan)
         if self.has_ip:
             ip = factory.pick_ip_in_Subnet(subnet)
-        ip_address = factory.make_StaticIPAddress(
+        # ip_is_on_vlan only reads attributes, so the IP address itself
+        # need not be persisted.
+        ip_address = StaticIPAddress(
             alloc_type=self.alloc_type, ip=ip, subnet=subnet
         )
         if not self.on_subnet:
-            # make_StaticIPAddress always creates a subnet so set it to None.
             ip_address.subnet = None
-            ip_address.save()
         self.assertEquals(
             self.result, dhcp.ip_is_on_vlan(ip_address, expected_vlan)
         )
@@ -1150,23 +1115,21 @@ class TestMakeSubnetConfig(MAASServerTestCase):
             search_list=default_domain.name,
         )
         self.assertIsInstance(config, dict)
-        self.assertThat(
+        self.assertLessEqual(
+            {
+                "subnet",
+                "subnet_mask",
+                "subnet_cidr",
+                "broadcast_ip",
+                "router_ip",
+                "dns_servers",
+                "ntp_servers",
+                "domain_name",
+                "search_list",
+                "pools",
+                "dhcp_snippets",
+            },
             config.keys(),
-            ContainsAll(
-                [
-                    "subnet",
-                    "subnet_mask",
-                    "subnet_cidr",
-                    "broadcast_ip",
-                    "router_ip",
-                    "dns_servers",
-                    "ntp_servers",
-                    "domain_name",
-                    "search_list",
-                    "pools",
-                    "dhcp_snippets",
-                ]
-            ),
         )
 
     def test__sets_ipv4_dns_from_arguments(self):
@@ -1655,16 +1618,19 @@ class TestMakeSubnetConfig(MAASServerTestCase):
             default_domain,
             subnets_dhcp_snippets=dhcp_snippets,
         )
-        self.assertItemsEqual(
-            [
-                {
-                    "name": dhcp_snippet.name,
-                    "description": dhcp_snippet.description,
-                    "value": dhcp_snippet.value.data,
-                }
-                for dhcp_snippet in dhcp_snippets
-            ],
-            config["dhcp_snippets"],
+        self.assertEqual(
+            sorted(
+                [
+                    {
+                        "name": dhcp_snippet.name,
+                        "description": dhcp_snippet.description,
+                        "value": dhcp_snippet.value.data,
+                    }
+                    for dhcp_snippet in dhcp_snippets
+                ],
+                key=itemgetter("name"),
+            ),
+            sorted(config["dhcp_snippets"], key=itemgetter("name")),
         )
 
 
@@ -1808,10 +1774,13 @@ class TestMakeHostsForSubnet(MAASServerTestCase):
                 "dhcp_snippets": [],
             },
         ]
-        self.assertItemsEqual(
-            expected_hosts,
-            dhcp.make_hosts_for_subnets(
-                [subnet], node_dhcp_snippets + device_dhcp_snippets
+        self.assertEqual(
+            sorted(expected_hosts, key=itemgetter("host")),
+            sorted(
+                dhcp.make_hosts_for_subnets(
+                    [subnet], node_dhcp_snippets + device_dhcp_snippets
+                ),
+                key=itemgetter("host"),
             ),
         )
 
@@ -1846,7 +1815,7 @@ class TestMakeHostsForSubnet(MAASServerTestCase):
                 "dhcp_snippets": [],
             }
         ]
-        self.assertItemsEqual(
+        self.assertEqual(
             expected_hosts,
             dhcp.make_hosts_for_subnets([subnet_one, subnet_two]),
         )
@@ -1904,8 +1873,12 @@ class TestMakeHostsForSubnet(MAASServerTestCase):
             },
         ]
 
-        self.assertItemsEqual(
-            expected_hosts, dhcp.make_hosts_for_subnets([subnet])
+        self.assertEqual(
+            sorted(expected_hosts, key=itemgetter("host")),
+            sorted(
+                dhcp.make_hosts_for_subnets([subnet]),
+                key=itemgetter("host"),
+            ),
         )
 
     def tests__returns_hosts_first_created_ip_address(self):
@@ -2174,8 +2147,12 @@ class TestGetDHCPConfigureFor(MAASServerTestCase):
             ),
             observed_subnets,
         )
-        self.assertItemsEqual(
-            dhcp.make_hosts_for_subnets([ha_subnet]), observed_hosts
+        self.assertEqual(
+            sorted(
+                dhcp.make_hosts_for_subnets([ha_subnet]),
+                key=itemgetter("host"),
+            ),
+            sorted(observed_hosts, key=itemgetter("host")),
         )
         self.assertEqual(primary_interface.name, observed_interface)
 
@@ -2325,8 +2302,12 @@ class TestGetDHCPConfigureFor(MAASServerTestCase):
             ),
             observed_subnets,
         )
-        self.assertItemsEqual(
-            dhcp.make_hosts_for_subnets([ha_subnet]), observed_hosts
+        self.assertEqual(
+            sorted(
+                dhcp.make_hosts_for_subnets([ha_subnet]),
+                key=itemgetter("host"),
+            ),
+            sorted(observed_hosts, key=itemgetter("host")),
         )
         self.assertEqual(primary_interface.name, observed_interface)
 
@@ -2416,6 +2397,44 @@ class TestGetDHCPConfiguration(MAASServerTestCase):
         )
 
 
+def make_interfaces_args(config):
+    """Return the v4 and v6 interface RPC arguments for `config`."""
+    return (
+        [{"name": name} for name in config.interfaces_v4],
+        [{"name": name} for name in config.interfaces_v6],
+    )
+
+
+def assert_dhcp_rpc_args(
+    test, ipv4_stub, ipv6_stub, config, interfaces_v4, interfaces_v6
+):
+    """Assert both family stubs were called once with `config`'s data."""
+    test.assertThat(
+        ipv4_stub,
+        MockCalledOnceWith(
+            ANY,
+            omapi_key=config.omapi_key,
+            failover_peers=config.failover_peers_v4,
+            shared_networks=config.shared_networks_v4,
+            hosts=config.hosts_v4,
+            interfaces=interfaces_v4,
+            global_dhcp_snippets=config.global_dhcp_snippets,
+        ),
+    )
+    test.assertThat(
+        ipv6_stub,
+        MockCalledOnceWith(
+            ANY,
+            omapi_key=config.omapi_key,
+            failover_peers=config.failover_peers_v6,
+            shared_networks=config.shared_networks_v6,
+            hosts=config.hosts_v6,
+            interfaces=interfaces_v6,
+            global_dhcp_snippets=config.global_dhcp_snippets,
+        ),
+    )
+
+
 class TestConfigureDHCP(MAASTransactionServerTestCase):
     """Tests for `configure_dhcp`."""
 
@@ -2535,8 +2554,7 @@ class TestConfigureDHCP(MAASTransactionServerTestCase):
         )
         ipv4_stub.side_effect = always_succeed_with({})
         ipv6_stub.side_effect = always_succeed_with({})
-        interfaces_v4 = [{"name": name} for name in config.interfaces_v4]
-        interfaces_v6 = [{"name": name} for name in config.interfaces_v6]
+        interfaces_v4, interfaces_v6 = make_interfaces_args(config)
 
         yield dhcp.configure_dhcp(rack_controller)
 
@@ -2544,29 +2562,8 @@ class TestConfigureDHCP(MAASTransactionServerTestCase):
             self.process_expected_shared_networks(config.shared_networks_v4)
             self.process_expected_shared_networks(config.shared_networks_v6)
 
-        self.assertThat(
-            ipv4_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v4,
-                shared_networks=config.shared_networks_v4,
-                hosts=config.hosts_v4,
-                interfaces=interfaces_v4,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
-        )
-        self.assertThat(
-            ipv6_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v6,
-                shared_networks=config.shared_networks_v6,
-                hosts=config.hosts_v6,
-                interfaces=interfaces_v6,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
+        assert_dhcp_rpc_args(
+            self, ipv4_stub, ipv6_stub, config, interfaces_v4, interfaces_v6
         )
 
     @wait_for_reactor
@@ -2852,8 +2849,7 @@ class TestValidateDHCPConfig(MAASTransactionServerTestCase):
     def test__calls_validate_for_both_ipv4_and_ipv6(self):
         rack_controller, config = self.create_rack_controller()
         ipv4_stub, ipv6_stub = self.prepare_rpc(rack_controller)
-        interfaces_v4 = [{"name": name} for name in config.interfaces_v4]
-        interfaces_v6 = [{"name": name} for name in config.interfaces_v6]
+        interfaces_v4, interfaces_v6 = make_interfaces_args(config)
 
         dhcp.validate_dhcp_config()
 
@@ -2861,36 +2857,14 @@ class TestValidateDHCPConfig(MAASTransactionServerTestCase):
             self.process_expected_shared_networks(config.shared_networks_v4)
             self.process_expected_shared_networks(config.shared_networks_v6)
 
-        self.assertThat(
-            ipv4_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v4,
-                shared_networks=config.shared_networks_v4,
-                hosts=config.hosts_v4,
-                interfaces=interfaces_v4,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
-        )
-        self.assertThat(
-            ipv6_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v6,
-                shared_networks=config.shared_networks_v6,
-                hosts=config.hosts_v6,
-                interfaces=interfaces_v6,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
+        assert_dhcp_rpc_args(
+            self, ipv4_stub, ipv6_stub, config, interfaces_v4, interfaces_v6
         )
 
     def test__calls_connected_rack_when_subnet_primary_rack_is_disconn(self):
         rack_controller, config = self.create_rack_controller()
         ipv4_stub, ipv6_stub = self.prepare_rpc(rack_controller)
-        interfaces_v4 = [{"name": name} for name in config.interfaces_v4]
-        interfaces_v6 = [{"name": name} for name in config.interfaces_v6]
+        interfaces_v4, interfaces_v6 = make_interfaces_args(config)
 
         disconnected_rack = factory.make_RackController(interface=False)
         vlan = factory.make_VLAN(primary_rack=disconnected_rack)
@@ -2908,36 +2882,14 @@ class TestValidateDHCPConfig(MAASTransactionServerTestCase):
             self.process_expected_shared_networks(config.shared_networks_v4)
             self.process_expected_shared_networks(config.shared_networks_v6)
 
-        self.assertThat(
-            ipv4_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v4,
-                shared_networks=config.shared_networks_v4,
-                hosts=config.hosts_v4,
-                interfaces=interfaces_v4,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
-        )
-        self.assertThat(
-            ipv6_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v6,
-                shared_networks=config.shared_networks_v6,
-                hosts=config.hosts_v6,
-                interfaces=interfaces_v6,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
+        assert_dhcp_rpc_args(
+            self, ipv4_stub, ipv6_stub, config, interfaces_v4, interfaces_v6
         )
 
     def test__calls_connected_rack_when_node_primary_rack_is_disconn(self):
         rack_controller, config = self.create_rack_controller()
         ipv4_stub, ipv6_stub = self.prepare_rpc(rack_controller)
-        interfaces_v4 = [{"name": name} for name in config.interfaces_v4]
-        interfaces_v6 = [{"name": name} for name in config.interfaces_v6]
+        interfaces_v4, interfaces_v6 = make_interfaces_args(config)
 
         disconnected_rack = factory.make_RackController(interface=False)
         vlan = factory.make_VLAN(
@@ -2962,36 +2914,14 @@ class TestValidateDHCPConfig(MAASTransactionServerTestCase):
             self.process_expected_shared_networks(config.shared_networks_v4)
             self.process_expected_shared_networks(config.shared_networks_v6)
 
-        self.assertThat(
-            ipv4_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v4,
-                shared_networks=config.shared_networks_v4,
-                hosts=config.hosts_v4,
-                interfaces=interfaces_v4,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
-        )
-        self.assertThat(
-            ipv6_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v6,
-                shared_networks=config.shared_networks_v6,
-                hosts=config.hosts_v6,
-                interfaces=interfaces_v6,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
+        assert_dhcp_rpc_args(
+            self, ipv4_stub, ipv6_stub, config, interfaces_v4, interfaces_v6
         )
 
     def test__calls_validate_with_new_dhcp_snippet(self):
         rack_controller, config = self.create_rack_controller()
         ipv4_stub, ipv6_stub = self.prepare_rpc(rack_controller)
-        interfaces_v4 = [{"name": name} for name in config.interfaces_v4]
-        interfaces_v6 = [{"name": name} for name in config.interfaces_v6]
+        interfaces_v4, interfaces_v6 = make_interfaces_args(config)
 
         # DHCPSnippetForm generates a new DHCPSnippet in memory and validates
         # it with validate_dhcp_config before committing it.
@@ -3012,36 +2942,14 @@ class TestValidateDHCPConfig(MAASTransactionServerTestCase):
             self.process_expected_shared_networks(config.shared_networks_v4)
             self.process_expected_shared_networks(config.shared_networks_v6)
 
-        self.assertThat(
-            ipv4_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v4,
-                shared_networks=config.shared_networks_v4,
-                hosts=config.hosts_v4,
-                interfaces=interfaces_v4,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
-        )
-        self.assertThat(
-            ipv6_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v6,
-                shared_networks=config.shared_networks_v6,
-                hosts=config.hosts_v6,
-                interfaces=interfaces_v6,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
+        assert_dhcp_rpc_args(
+            self, ipv4_stub, ipv6_stub, config, interfaces_v4, interfaces_v6
         )
 
     def test__calls_validate_with_disabled_dhcp_snippet(self):
         rack_controller, config = self.create_rack_controller()
         ipv4_stub, ipv6_stub = self.prepare_rpc(rack_controller)
-        interfaces_v4 = [{"name": name} for name in config.interfaces_v4]
-        interfaces_v6 = [{"name": name} for name in config.interfaces_v6]
+        interfaces_v4, interfaces_v6 = make_interfaces_args(config)
 
         new_dhcp_snippet = factory.make_DHCPSnippet(enabled=False)
         dhcp.validate_dhcp_config(new_dhcp_snippet)
@@ -3057,85 +2965,36 @@ class TestValidateDHCPConfig(MAASTransactionServerTestCase):
             self.process_expected_shared_networks(config.shared_networks_v4)
             self.process_expected_shared_networks(config.shared_networks_v6)
 
-        self.assertThat(
-            ipv4_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v4,
-                shared_networks=config.shared_networks_v4,
-                hosts=config.hosts_v4,
-                interfaces=interfaces_v4,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
-        )
-        self.assertThat(
-            ipv6_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v6,
-                shared_networks=config.shared_networks_v6,
-                hosts=config.hosts_v6,
-                interfaces=interfaces_v6,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
+        assert_dhcp_rpc_args(
+            self, ipv4_stub, ipv6_stub, config, interfaces_v4, interfaces_v6
         )
 
     def test__calls_validate_with_updated_dhcp_snippet(self):
         rack_controller, config = self.create_rack_controller()
         ipv4_stub, ipv6_stub = self.prepare_rpc(rack_controller)
-        interfaces_v4 = [{"name": name} for name in config.interfaces_v4]
-        interfaces_v6 = [{"name": name} for name in config.interfaces_v6]
+        interfaces_v4, interfaces_v6 = make_interfaces_args(config)
 
+        # Any global snippet will do; picking the first keeps the test
+        # deterministic and the expected-args patch a direct index update.
         updated_dhcp_snippet = DHCPSnippet.objects.get(
-            name=random.choice(
-                [
-                    dhcp_snippet["name"]
-                    for dhcp_snippet in config.global_dhcp_snippets
-                ]
-            )
+            name=config.global_dhcp_snippets[0]["name"]
         )
         updated_dhcp_snippet.value = updated_dhcp_snippet.value.update(
             factory.make_string()
         )
         dhcp.validate_dhcp_config(updated_dhcp_snippet)
-        for i, dhcp_snippet in enumerate(config.global_dhcp_snippets):
-            if dhcp_snippet["name"] == updated_dhcp_snippet.name:
-                config.global_dhcp_snippets[i] = {
-                    "name": updated_dhcp_snippet.name,
-                    "description": updated_dhcp_snippet.description,
-                    "value": updated_dhcp_snippet.value.data,
-                }
-                break
+        config.global_dhcp_snippets[0] = {
+            "name": updated_dhcp_snippet.name,
+            "description": updated_dhcp_snippet.description,
+            "value": updated_dhcp_snippet.value.data,
+        }
 
         if self.process_expected_shared_networks is not None:
             self.process_expected_shared_networks(config.shared_networks_v4)
             self.process_expected_shared_networks(config.shared_networks_v6)
 
-        self.assertThat(
-            ipv4_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v4,
-                shared_networks=config.shared_networks_v4,
-                hosts=config.hosts_v4,
-                interfaces=interfaces_v4,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
-        )
-        self.assertThat(
-            ipv6_stub,
-            MockCalledOnceWith(
-                ANY,
-                omapi_key=config.omapi_key,
-                failover_peers=config.failover_peers_v6,
-                shared_networks=config.shared_networks_v6,
-                hosts=config.hosts_v6,
-                interfaces=interfaces_v6,
-                global_dhcp_snippets=config.global_dhcp_snippets,
-            ),
+        assert_dhcp_rpc_args(
+            self, ipv4_stub, ipv6_stub, config, interfaces_v4, interfaces_v6
         )
 
     def test__returns_no_errors_when_valid(self):
@@ -3154,7 +3013,7 @@ class TestValidateDHCPConfig(MAASTransactionServerTestCase):
         }
         self.prepare_rpc(rack_controller, [dhcpd_error])
 
-        self.assertItemsEqual([dhcpd_error], dhcp.validate_dhcp_config())
+        self.assertEqual([dhcpd_error], dhcp.validate_dhcp_config())
 
     def test__dedups_errors(self):
         rack_controller, config = self.create_rack_controller()
@@ -3166,7 +3025,7 @@ class TestValidateDHCPConfig(MAASTransactionServerTestCase):
         }
         self.prepare_rpc(rack_controller, [dhcpd_error, dhcpd_error])
 
-        self.assertItemsEqual([dhcpd_error], dhcp.validate_dhcp_config())
+        self.assertEqual([dhcpd_error], dhcp.validate_dhcp_config())
 
     def test__rack_not_found_raises_validation_error(self):
         subnet = factory.make_Subnet()
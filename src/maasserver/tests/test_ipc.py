@@ -13,7 +13,6 @@ import uuid
 
 from crochet import wait_for
 from fixtures import EnvironmentVariableFixture
-from testtools.matchers import MatchesStructure
 from twisted.internet import reactor
 from twisted.internet.defer import inlineCallbacks, succeed
 
@@ -24,7 +23,6 @@ from maasserver.ipc import (
     IPCMasterService,
     IPCWorkerService,
 )
-from maasserver.models import timestampedmodel
 from maasserver.models.node import RegionController
 from maasserver.models.regioncontrollerprocess import RegionControllerProcess
 from maasserver.models.regioncontrollerprocessendpoint import (
@@ -40,7 +38,6 @@ from maasserver.testing.testcase import MAASTransactionServerTestCase
 from maasserver.utils.orm import reload_object
 from maasserver.utils.threads import deferToDatabase
 from maastesting.fixtures import TempDirectory
-from maastesting.matchers import MockCalledOnceWith
 from maastesting.runtest import MAASCrochetRunTest
 from maastesting.testcase import MAASTestCase
 from provisioningserver.utils.twisted import callOut, DeferredValue
@@ -174,7 +171,7 @@ class TestIPCCommunication(MAASTransactionServerTestCase):
         yield disconnected.get(timeout=2)
         yield master.stopService()
 
-        self.assertThat(workers.killWorker, MockCalledOnceWith(pid))
+        workers.killWorker.assert_called_once_with(pid)
 
     @wait_for_reactor
     @inlineCallbacks
@@ -235,13 +232,11 @@ class TestIPCCommunication(MAASTransactionServerTestCase):
 
         regiond_service = yield deferToDatabase(self.getRegiondService)
 
-        self.assertThat(
-            regiond_service,
-            MatchesStructure.byEquality(
-                status=SERVICE_STATUS.DEGRADED,
-                status_info="1 process running but %s were expected."
-                % (workers.MAX_WORKERS_COUNT),
-            ),
+        self.assertEqual(SERVICE_STATUS.DEGRADED, regiond_service.status)
+        self.assertEqual(
+            "1 process running but %s were expected."
+            % (workers.MAX_WORKERS_COUNT),
+            regiond_service.status_info,
         )
 
         yield master.stopService()
@@ -373,9 +368,6 @@ class TestIPCCommunication(MAASTransactionServerTestCase):
     @wait_for_reactor
     @inlineCallbacks
     def test_update_updates_updated_time_on_processes(self):
-        current_time = now()
-        self.patch(timestampedmodel, "now").return_value = current_time
-
         master = self.make_IPCMasterService()
         yield master.startService()
 
@@ -383,20 +375,20 @@ class TestIPCCommunication(MAASTransactionServerTestCase):
         yield master.registerWorker(pid, MagicMock())
 
         def set_to_old_time(procId):
-            old_time = current_time - timedelta(seconds=90)
+            old_time = now() - timedelta(seconds=90)
             region_process = RegionControllerProcess.objects.get(id=procId)
-            region_process.created = region_process.updated = old_time
-            region_process.save()
+            region_process.save(_created=old_time, _updated=old_time)
             return region_process
 
         region_process = yield deferToDatabase(
             set_to_old_time, master.connections[pid]["process_id"]
         )
+        old_updated = region_process.updated
 
         yield master.update()
 
         region_process = yield deferToDatabase(reload_object, region_process)
-        self.assertEquals(current_time, region_process.updated)
+        self.assertGreater(region_process.updated, old_updated)
 
         yield master.stopService()
 
@@ -414,12 +406,8 @@ class TestIPCCommunication(MAASTransactionServerTestCase):
 
         # The service status for the region should now be running.
         regiond_service = yield deferToDatabase(self.getRegiondService)
-        self.assertThat(
-            regiond_service,
-            MatchesStructure.byEquality(
-                status=SERVICE_STATUS.RUNNING, status_info=""
-            ),
-        )
+        self.assertEqual(SERVICE_STATUS.RUNNING, regiond_service.status)
+        self.assertEqual("", regiond_service.status_info)
 
         # Delete all the processes and an update should re-create them
         # and the service status should still be running.
@@ -431,12 +419,8 @@ class TestIPCCommunication(MAASTransactionServerTestCase):
 
         yield master.update()
         regiond_service = yield deferToDatabase(self.getRegiondService)
-        self.assertThat(
-            regiond_service,
-            MatchesStructure.byEquality(
-                status=SERVICE_STATUS.RUNNING, status_info=""
-            ),
-        )
+        self.assertEqual(SERVICE_STATUS.RUNNING, regiond_service.status)
+        self.assertEqual("", regiond_service.status_info)
 
         yield master.stopService()
 
@@ -453,8 +437,8 @@ class TestIPCCommunication(MAASTransactionServerTestCase):
         yield master.registerWorker(pid, MagicMock())
         yield master.update()
 
-        self.assertThat(
-            mock_mark_dead, MockCalledOnceWith(other_region, dead_region=True)
+        mock_mark_dead.assert_called_once_with(
+            other_region, dead_region=True
         )
 
         yield master.stopService()
@@ -492,6 +476,6 @@ class TestIPCCommunication(MAASTransactionServerTestCase):
         rpc_connections = yield deferToDatabase(
             reload_connections, rpc_connections
         )
-        self.assertItemsEqual(rpc_connections, [])
+        self.assertEqual([], rpc_connections)
 
         yield master.stopService()
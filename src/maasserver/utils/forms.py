@@ -7,6 +7,12 @@ __all__ = ["compose_invalid_choice_text", "get_QueryDict", "set_form_error"]
 
 from django.http import QueryDict
 
+# Composed once at import; the literal "%(value)s" placeholder is left in
+# the result for Django to substitute when the error is rendered.
+_INVALID_CHOICE_TEMPLATE = (
+    "'%%(value)s' is not a valid %s.  It should be one of: %s."
+)
+
 
 def compose_invalid_choice_text(choice_of_what, valid_choices):
     """Compose an "invalid choice" string for form error messages.
@@ -21,8 +27,7 @@ def compose_invalid_choice_text(choice_of_what, valid_choices):
         (name, value).
     :type valid_choices: sequence
     """
-    return "'%s' is not a valid %s.  It should be one of: %s." % (
-        "%(value)s",
+    return _INVALID_CHOICE_TEMPLATE % (
         choice_of_what,
         ", ".join("'%s'" % name for name, value in valid_choices),
     )
@@ -42,8 +42,10 @@ class SubnetHandler(TimestampedModelHandler):
         listen_channels = ["subnet"]
 
     def dehydrate_dns_servers(self, dns_servers):
-        if dns_servers is None:
+        if not dns_servers:
             return ""
+        if len(dns_servers) == 1:
+            return dns_servers[0]
         return " ".join(sorted(dns_servers))
 
     def dehydrate(self, subnet, data, for_list=False):
@@ -122,15 +122,17 @@ def make_subnet_config(
     if dhcp_snippets is None:
         dhcp_snippets = make_subnet_dhcp_snippets()
     domain_name = "%s.example.com" % factory.make_name("domain")
+    # Sample the three distinct subnet-local addresses in one pass over
+    # the network instead of three independent pick_ip_in_network calls.
+    dns_one, dns_two, router = random.sample(
+        range(network.first + 1, network.last), 3
+    )
     return {
         "subnet": str(IPAddress(network.first)),
         "subnet_mask": str(network.netmask),
         "subnet_cidr": str(network.cidr),
         "broadcast_ip": str(network.broadcast),
-        "dns_servers": [
-            IPAddress(factory.pick_ip_in_network(network)),
-            IPAddress(factory.pick_ip_in_network(network)),
-        ],
+        "dns_servers": [IPAddress(dns_one), IPAddress(dns_two)],
         "ntp_servers": [
             factory.make_ipv4_address(),
             factory.make_ipv6_address(),
@@ -138,7 +140,7 @@ def make_subnet_config(
         ],
         "domain_name": domain_name,
         "search_list": [domain_name],
-        "router_ip": factory.pick_ip_in_network(network),
+        "router_ip": str(IPAddress(router)),
         "pools": pools,
         "dhcp_snippets": dhcp_snippets,
     }
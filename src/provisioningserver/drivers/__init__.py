@@ -5,7 +5,7 @@
 
 __all__ = ["Architecture", "ArchitectureRegistry"]
 
-from jsonschema import validate
+from jsonschema import Draft4Validator
 
 from provisioningserver.utils import typed
 from provisioningserver.utils.registry import Registry
@@ -70,7 +70,14 @@ CHOICE_FIELD_SCHEMA = {
     },
 }
 
-# JSON schema for what a settings field should look like.
+# Pre-built so make_setting_field does not construct a validator (and
+# re-check the schema against the meta-schema) on every call.
+CHOICE_FIELD_SCHEMA_VALIDATOR = Draft4Validator(CHOICE_FIELD_SCHEMA)
+
+# JSON schema for what a settings field should look like. Treat this as
+# immutable: it is baked into validators compiled once at import time
+# (see maasserver.clusterrpc.driver_parameters), so mutating it at
+# runtime would silently desynchronise those validators.
 SETTING_PARAMETER_FIELD_SCHEMA = {
     "title": "Setting parameter field",
     "type": "object",
@@ -131,7 +138,7 @@ def make_setting_field(
         field_type = "string"
     if choices is None:
         choices = []
-    validate(choices, CHOICE_FIELD_SCHEMA)
+    CHOICE_FIELD_SCHEMA_VALIDATOR.validate(choices)
     if default is None:
         default = ""
     if scope not in (SETTING_SCOPE.BMC, SETTING_SCOPE.NODE):
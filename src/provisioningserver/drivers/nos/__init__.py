@@ -31,7 +31,8 @@ JSON_NOS_DRIVER_SCHEMA = {
 }
 
 
-# JSON schema for multiple NOS drivers.
+# JSON schema for multiple NOS drivers. Treat as immutable: validators
+# are compiled against it once at import time.
 JSON_NOS_DRIVERS_SCHEMA = {
     "title": "NOS drivers parameters set",
     "type": "array",
@@ -57,7 +57,8 @@ JSON_POWER_DRIVER_SCHEMA = {
     "required": ["driver_type", "name", "description", "fields"],
 }
 
-# JSON schema for multiple power drivers.
+# JSON schema for multiple power drivers. Treat as immutable: validators
+# are compiled against it once at import time.
 JSON_POWER_DRIVERS_SCHEMA = {
     "title": "Power drivers parameters set",
     "type": "array",